@@ -56,14 +56,44 @@ __all__ = [
     "__version__",
 ]
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .manifest import Manifest, load_manifest
 from .validator import Validator, ValidationResult, validate_manifest
 from .agent_card import generate_agent_card, compute_manifest_digest
 from .exceptions import OSSAError, ValidationError, ConfigurationError, ExecutionError
-from .agent import Agent, AgentRunner, AgentResponse
-from .task import Task, TaskRunner
-from .workflow import Workflow, WorkflowRunner
+
+if TYPE_CHECKING:
+    from .agent import Agent, AgentRunner, AgentResponse
+    from .task import Task, TaskRunner
+    from .workflow import Workflow, WorkflowRunner
 
 # Convenience aliases
 load = load_manifest
 validate = validate_manifest
+
+# Runtime classes pull in pydantic, asyncio and the full manifest type model,
+# so they are imported on first access (PEP 562) rather than with the package.
+_LAZY_IMPORTS = {
+    "Agent": ".agent",
+    "AgentRunner": ".agent",
+    "AgentResponse": ".agent",
+    "Task": ".task",
+    "TaskRunner": ".task",
+    "Workflow": ".workflow",
+    "WorkflowRunner": ".workflow",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
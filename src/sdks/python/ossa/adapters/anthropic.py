@@ -3,7 +3,7 @@ Anthropic Claude Adapter
 """
 
 import asyncio
-from typing import Optional, Dict, Any, AsyncIterator
+from typing import Optional, Dict, Any, AsyncIterator, List
 import anthropic
 from .base import BaseAdapter, AdapterResponse
 
@@ -12,10 +12,11 @@ class AnthropicAdapter(BaseAdapter):
     """Anthropic Claude adapter"""
     
     def __init__(self):
-        self.client: Optional[anthropic.Anthropic] = None
+        self.client: Optional[anthropic.AsyncAnthropic] = None
         self.api_key: Optional[str] = None
         self.model: str = "claude-3-5-sonnet-20241022"
         self.tools: Dict[str, callable] = {}
+        self._tool_schemas: Optional[List[Dict[str, Any]]] = None
     
     async def initialize(self, manifest: Dict[str, Any], api_key: Optional[str] = None) -> None:
         """Initialize Anthropic client"""
@@ -23,7 +24,7 @@ class AnthropicAdapter(BaseAdapter):
         if not self.api_key:
             raise ValueError("Anthropic API key required")
         
-        self.client = anthropic.Anthropic(api_key=self.api_key)
+        self.client = anthropic.AsyncAnthropic(api_key=self.api_key)
         
         # Get model from manifest
         llm_config = manifest.get('spec', {}).get('llm', {})
@@ -38,23 +39,11 @@ class AnthropicAdapter(BaseAdapter):
         # Prepare messages
         messages = kwargs.get('messages', [{'role': 'user', 'content': message}])
         
-        # Prepare tools if any
-        tools = None
-        if self.tools:
-            tools = [
-                {
-                    'name': name,
-                    'description': 'Tool handler',
-                    'input_schema': {'type': 'object', 'properties': {}}
-                }
-                for name in self.tools.keys()
-            ]
-        
         # Call API
-        response = self.client.messages.create(
+        response = await self.client.messages.create(
             model=self.model,
             messages=messages,
-            tools=tools,
+            tools=self._get_tool_schemas(),
             max_tokens=kwargs.get('max_tokens', 4096),
             temperature=kwargs.get('temperature', 0.7),
         )
@@ -97,18 +86,32 @@ class AnthropicAdapter(BaseAdapter):
         
         messages = kwargs.get('messages', [{'role': 'user', 'content': message}])
         
-        with self.client.messages.stream(
+        async with self.client.messages.stream(
             model=self.model,
             messages=messages,
             max_tokens=kwargs.get('max_tokens', 4096),
             temperature=kwargs.get('temperature', 0.7),
         ) as stream:
-            for text in stream.text_stream:
+            async for text in stream.text_stream:
                 yield text
     
+    def _get_tool_schemas(self) -> Optional[List[Dict[str, Any]]]:
+        """Tool definitions sent with each request, built once per tool set"""
+        if self._tool_schemas is None and self.tools:
+            self._tool_schemas = [
+                {
+                    'name': name,
+                    'description': 'Tool handler',
+                    'input_schema': {'type': 'object', 'properties': {}}
+                }
+                for name in self.tools.keys()
+            ]
+        return self._tool_schemas
+    
     def register_tool_handler(self, name: str, handler: callable) -> None:
         """Register tool handler"""
         self.tools[name] = handler
+        self._tool_schemas = None
     
     async def call_tool(self, tool_name: str, tool_input: Dict[str, Any]) -> Any:
         """Call a registered tool"""
@@ -12,7 +12,7 @@ class OpenAIAdapter(BaseAdapter):
     """OpenAI adapter"""
     
     def __init__(self):
-        self.client: Optional[openai.OpenAI] = None
+        self.client: Optional[openai.AsyncOpenAI] = None
         self.api_key: Optional[str] = None
         self.model: str = "gpt-4"
         self.tools: Dict[str, callable] = {}
@@ -23,7 +23,7 @@ class OpenAIAdapter(BaseAdapter):
         if not self.api_key:
             raise ValueError("OpenAI API key required")
         
-        self.client = openai.OpenAI(api_key=self.api_key)
+        self.client = openai.AsyncOpenAI(api_key=self.api_key)
         
         # Get model from manifest
         llm_config = manifest.get('spec', {}).get('llm', {})
@@ -37,7 +37,7 @@ class OpenAIAdapter(BaseAdapter):
         
         messages = kwargs.get('messages', [{'role': 'user', 'content': message}])
         
-        response = self.client.chat.completions.create(
+        response = await self.client.chat.completions.create(
             model=self.model,
             messages=messages,
             max_tokens=kwargs.get('max_tokens', 4096),
@@ -77,7 +77,7 @@ class OpenAIAdapter(BaseAdapter):
         
         messages = kwargs.get('messages', [{'role': 'user', 'content': message}])
         
-        stream = self.client.chat.completions.create(
+        stream = await self.client.chat.completions.create(
             model=self.model,
             messages=messages,
             max_tokens=kwargs.get('max_tokens', 4096),
@@ -85,7 +85,7 @@ class OpenAIAdapter(BaseAdapter):
             stream=True,
         )
         
-        for chunk in stream:
+        async for chunk in stream:
             if chunk.choices[0].delta.content:
                 yield chunk.choices[0].delta.content
     
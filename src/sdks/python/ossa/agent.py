@@ -6,9 +6,11 @@ LLM integration, tool calling, safety checks, and state management.
 """
 
 import asyncio
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Generator, Iterator, List, Optional, Union
 
 from pydantic import BaseModel
 
@@ -16,6 +18,38 @@ from .exceptions import ConfigurationError, OSSAError
 from .types import AgentSpec, OSSAManifest
 
 
+# LLM clients shared between runners, keyed by (client class, API key) and
+# LRU-ordered so processes serving many tenants don't keep every key alive.
+SHARED_CLIENT_MAXSIZE = 16
+
+_shared_clients: "OrderedDict[tuple[Any, str], Any]" = OrderedDict()
+_shared_clients_lock = threading.Lock()
+
+
+def _shared_client(client_cls: Any, api_key: Optional[str]) -> Any:
+    """
+    Get the LLM client for a provider class and API key.
+
+    Clients for an explicit API key are shared between runners so their HTTP
+    connection pools (and TLS sessions) are reused across agents and requests.
+    Without a key the SDK reads it from the environment at construction, so
+    those clients are never shared.
+    """
+    if api_key is None:
+        return client_cls(api_key=api_key)
+
+    key = (client_cls, api_key)
+    with _shared_clients_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            client = client_cls(api_key=api_key)
+            _shared_clients[key] = client
+            while len(_shared_clients) > SHARED_CLIENT_MAXSIZE:
+                _shared_clients.popitem(last=False)
+        _shared_clients.move_to_end(key)
+    return client
+
+
 class AgentResponse(BaseModel):
     """
     Response from an agent execution.
@@ -66,10 +100,18 @@ class ConversationHistory:
 
         # Trim if exceeds max
         if len(self.messages) > self.max_messages:
-            # Keep system message (first) and trim oldest user/assistant messages
-            system_messages = [m for m in self.messages if m["role"] == "system"]
-            other_messages = [m for m in self.messages if m["role"] != "system"]
-            self.messages = system_messages + other_messages[-(self.max_messages - len(system_messages)) :]
+            self._trim()
+
+    def _trim(self) -> None:
+        """Drop the oldest user/assistant messages in place, keeping system messages."""
+        excess = len(self.messages) - self.max_messages
+        idx = 0
+        while excess > 0 and idx < len(self.messages):
+            if self.messages[idx]["role"] == "system":
+                idx += 1
+            else:
+                del self.messages[idx]
+                excess -= 1
 
     def get_messages(self) -> List[Dict[str, Any]]:
         """Get all messages in the conversation."""
@@ -193,7 +235,7 @@ class AgentRunner:
             try:
                 import anthropic
 
-                self._client = anthropic.Anthropic(api_key=self.api_key)
+                self._client = _shared_client(anthropic.Anthropic, self.api_key)
                 return self._client
             except ImportError:
                 raise ConfigurationError(
@@ -205,7 +247,7 @@ class AgentRunner:
             try:
                 import openai
 
-                self._client = openai.OpenAI(api_key=self.api_key)
+                self._client = _shared_client(openai.OpenAI, self.api_key)
                 return self._client
             except ImportError:
                 raise ConfigurationError("OpenAI SDK not installed. Install with: pip install openai")
@@ -226,7 +268,8 @@ class AgentRunner:
                 - temperature: Override LLM temperature
                 - max_tokens: Override max tokens
                 - tools: Override tools list
-                - stream: Enable streaming (default: False)
+
+            Use stream() to receive the reply incrementally.
 
         Returns:
             AgentResponse with the agent's reply and metadata
@@ -240,7 +283,7 @@ class AgentRunner:
             "The capital of France is Paris."
             >>> print(f"Cost: ${response.cost:.4f}")
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # Add user message to history
         self.history.add_message("user", input_text)
@@ -270,7 +313,7 @@ class AgentRunner:
             self.history.add_message("assistant", response_content)
 
             # Calculate duration
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
 
             # Increment request counter
             self._request_count += 1
@@ -292,6 +335,67 @@ class AgentRunner:
         except Exception as e:
             raise OSSAError(f"Agent execution failed: {e}") from e
 
+    def stream(self, input_text: str, **kwargs: Any) -> Iterator[str]:
+        """
+        Execute the agent and yield the reply as it is generated.
+
+        The reply is added to the conversation history when the stream ends.
+        If the consumer stops early, the partial reply is recorded; if no text
+        was received (e.g. the provider failed), the user turn is dropped so
+        history never holds two consecutive user messages.
+
+        Args:
+            input_text: User input/prompt to send to the agent
+            **kwargs: Additional parameters (same as run())
+
+        Yields:
+            Chunks of response text
+
+        Raises:
+            OSSAError: If execution fails
+
+        Example:
+            >>> for chunk in agent.stream("Tell me a story"):
+            ...     print(chunk, end="", flush=True)
+        """
+        # Add user message to history
+        self.history.add_message("user", input_text)
+        user_message = self.history.messages[-1]
+
+        chunks: List[str] = []
+        pieces: Optional[Generator[str, None, None]] = None
+        try:
+            client = self._get_client()
+            provider = self.spec.llm.provider.lower()
+
+            temperature = kwargs.get("temperature", self.spec.llm.temperature)
+            max_tokens = kwargs.get("max_tokens", self.spec.llm.max_tokens)
+
+            if provider == "anthropic":
+                pieces = self._stream_anthropic(client, temperature, max_tokens)
+            elif provider == "openai":
+                pieces = self._stream_openai(client, temperature, max_tokens)
+            else:
+                raise ConfigurationError(f"Provider '{provider}' is not supported for execution")
+
+            for piece in pieces:
+                chunks.append(piece)
+                yield piece
+
+            self._request_count += 1
+
+        except Exception as e:
+            raise OSSAError(f"Agent execution failed: {e}") from e
+
+        finally:
+            # Release the provider stream if the consumer stopped early
+            if pieces is not None:
+                pieces.close()
+            if chunks:
+                self.history.add_message("assistant", "".join(chunks))
+            elif self.history.messages and self.history.messages[-1] is user_message:
+                self.history.messages.pop()
+
     async def arun(self, input_text: str, **kwargs: Any) -> AgentResponse:
         """
         Execute the agent with input text (asynchronous).
@@ -309,8 +413,7 @@ class AgentRunner:
         """
         # For now, run synchronously in a thread pool
         # Future: Implement proper async clients
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, lambda: self.run(input_text, **kwargs))
+        return await asyncio.to_thread(self.run, input_text, **kwargs)
 
     def _execute_anthropic(
         self,
@@ -387,6 +490,43 @@ class AgentRunner:
             return response.choices[0].message.content or ""
         return ""
 
+    def _stream_anthropic(
+        self,
+        client: Any,
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+    ) -> Generator[str, None, None]:
+        """Stream response text from the Anthropic API."""
+        messages = [m for m in self.history.get_messages() if m["role"] != "system"]
+
+        with client.messages.stream(
+            model=self.spec.llm.model,
+            max_tokens=max_tokens or 4096,
+            temperature=temperature if temperature is not None else 0.7,
+            system=self.spec.role if self.spec.role else None,
+            messages=messages,
+        ) as stream:
+            yield from stream.text_stream
+
+    def _stream_openai(
+        self,
+        client: Any,
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+    ) -> Generator[str, None, None]:
+        """Stream response text from the OpenAI API."""
+        response = client.chat.completions.create(
+            model=self.spec.llm.model,
+            messages=self.history.get_messages(),
+            temperature=temperature if temperature is not None else 0.7,
+            max_tokens=max_tokens,
+            stream=True,
+        )
+
+        for chunk in response:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
     def reset(self) -> None:
         """
         Reset the agent's conversation history.
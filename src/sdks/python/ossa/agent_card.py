@@ -27,13 +27,16 @@ def _extract_capabilities(manifest: dict[str, Any]) -> list[str]:
     labels = _get(manifest, "metadata", "labels") or {}
     if isinstance(labels.get("capability"), str):
         capabilities.extend(c.strip() for c in labels["capability"].split(","))
+    seen = set(capabilities)
     for tag in manifest.get("metadata", {}).get("tags") or []:
-        if tag and tag not in capabilities:
-            capabilities.append(tag)
+        if tag and str(tag) not in seen:
+            seen.add(str(tag))
+            capabilities.append(str(tag))
     spec_caps = (manifest.get("spec") or {}).get("capabilities") or []
     for cap in spec_caps:
         name = cap.get("id") or cap.get("name") if isinstance(cap, dict) else cap
-        if name and name not in capabilities:
+        if name and str(name) not in seen:
+            seen.add(str(name))
             capabilities.append(str(name))
     return capabilities
 
@@ -13,12 +13,15 @@ router = APIRouter(prefix="/api/v1/agents", tags=["agents"])
 
 
 # Dependency injection
+# One repository per process so agents persist across requests
+_repository = AgentRepository()
+
+
 def get_service() -> AgentService:
-    repository = AgentRepository()
-    return AgentService(repository)
+    return AgentService(_repository)
 
 
-@router.get("/", response_model=List[Dict[str, Any]])
+@router.get("/")
 async def list_agents(
     filters: Optional[Dict[str, Any]] = None,
     service: AgentService = Depends(get_service)
@@ -26,12 +29,12 @@ async def list_agents(
     """List all agents"""
     try:
         agents = await service.list(filters)
-        return [agent.dict() for agent in agents]
+        return [agent.to_dict() for agent in agents]
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/{agent_id}", response_model=Dict[str, Any])
+@router.get("/{agent_id}")
 async def get_agent(
     agent_id: str,
     service: AgentService = Depends(get_service)
@@ -39,30 +42,30 @@ async def get_agent(
     """Get agent by ID"""
     try:
         agent = await service.get_by_id(agent_id)
-        return agent.dict()
+        return agent.to_dict()
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/", response_model=Dict[str, Any], status_code=201)
+@router.post("/", status_code=201)
 async def create_agent(
     manifest_data: Dict[str, Any],
     service: AgentService = Depends(get_service)
 ):
     """Create new agent"""
     try:
-        manifest = Manifest(**manifest_data)
+        manifest = Manifest.from_dict(manifest_data)
         agent = await service.create(manifest)
-        return agent.dict()
+        return agent.to_dict()
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.put("/{agent_id}", response_model=Dict[str, Any])
+@router.put("/{agent_id}")
 async def update_agent(
     agent_id: str,
     manifest_data: Dict[str, Any],
@@ -70,9 +73,9 @@ async def update_agent(
 ):
     """Update agent"""
     try:
-        manifest = Manifest(**manifest_data)
+        manifest = Manifest.from_dict(manifest_data)
         agent = await service.update(agent_id, manifest)
-        return agent.dict()
+        return agent.to_dict()
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -59,14 +59,14 @@ class AgentRepository(IAgentRepository):
             return [
                 agent for agent in all_agents
                 if all(
-                    getattr(agent.metadata, key, None) == value
+                    agent.metadata.get(key) == value
                     for key, value in filters.items()
                 )
             ]
         return all_agents
     
     async def create(self, manifest: Manifest) -> Manifest:
-        agent_id = manifest.metadata.name
+        agent_id = manifest.name
         if agent_id in self._storage:
             raise ValueError(f"Agent {agent_id} already exists")
         self._storage[agent_id] = manifest
@@ -7,7 +7,6 @@ https://github.com/cloudevents/spec/blob/v1.0.2/cloudevents/spec.md
 
 import time
 import uuid
-from datetime import datetime, timezone
 from typing import Any, Dict, Generic, Literal, Optional, TypeVar
 
 from pydantic import BaseModel, Field
@@ -16,6 +15,21 @@ from .sinks import CloudEventsSink, StdoutSink
 
 T = TypeVar("T")
 
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS") of the last timestamp;
+# the date/time prefix only needs formatting once per second.
+_timestamp_prefix: tuple[int, str] = (-1, "")
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as RFC 3339 with microseconds, e.g. 2024-01-27T12:00:00.000000+00:00."""
+    global _timestamp_prefix
+    seconds, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    cached_seconds, prefix = _timestamp_prefix
+    if seconds != cached_seconds:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _timestamp_prefix = (seconds, prefix)
+    return f"{prefix}.{micros:06d}+00:00"
+
 
 class CloudEvent(BaseModel, Generic[T]):
     """
@@ -147,7 +161,7 @@ class CloudEventsEmitter:
             flush_interval_ms=flush_interval_ms,
         )
         self.buffer: list[CloudEvent[Any]] = []
-        self._last_flush_time = time.time()
+        self._last_flush_ns = time.monotonic_ns()
         self._flush_timer_enabled = flush_interval_ms is not None
 
     def emit(
@@ -213,7 +227,7 @@ class CloudEventsEmitter:
 
         events = self.buffer[:]
         self.buffer.clear()
-        self._last_flush_time = time.time()
+        self._last_flush_ns = time.monotonic_ns()
         self._send(events)
 
     def destroy(self) -> None:
@@ -230,15 +244,15 @@ class CloudEventsEmitter:
 
     def _generate_timestamp(self) -> str:
         """Generate ISO 8601 timestamp."""
-        return datetime.now(timezone.utc).isoformat()
+        return _utc_timestamp()
 
     def _should_auto_flush(self) -> bool:
         """Check if auto-flush interval has elapsed."""
         if not self._flush_timer_enabled or not self.config.flush_interval_ms:
             return False
 
-        elapsed_ms = (time.time() - self._last_flush_time) * 1000
-        return elapsed_ms >= self.config.flush_interval_ms
+        elapsed_ns = time.monotonic_ns() - self._last_flush_ns
+        return elapsed_ns >= self.config.flush_interval_ms * 1_000_000
 
     def _send(self, events: list[CloudEvent[Any]]) -> None:
         """Send events to configured sink."""
@@ -9,12 +9,17 @@ Provides structured formatting for various output formats:
 
 import json
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List
 
 if TYPE_CHECKING:
     from .cloudevents import CloudEvent
 
 
+def _compact_array(items: Iterable[str]) -> str:
+    """Join already-serialized compact JSON values into a compact JSON array."""
+    return "[" + ",".join(items) + "]"
+
+
 class CloudEventsFormatter(ABC):
     """Abstract base class for CloudEvents formatters."""
 
@@ -92,10 +97,10 @@ class JsonFormatter(CloudEventsFormatter):
 
     def format(self, event: "CloudEvent[Any]") -> str:
         """Format a single CloudEvent as JSON."""
+        if not self.pretty:
+            return event.model_dump_json(exclude_none=self.exclude_none)
         data = event.model_dump(exclude_none=self.exclude_none)
-        if self.pretty:
-            return json.dumps(data, indent=self.indent, ensure_ascii=False)
-        return json.dumps(data, ensure_ascii=False)
+        return json.dumps(data, indent=self.indent, ensure_ascii=False)
 
     def format_batch(self, events: List["CloudEvent[Any]"]) -> str:
         """
@@ -107,10 +112,12 @@ class JsonFormatter(CloudEventsFormatter):
         Returns:
             JSON array of events
         """
+        if not self.pretty:
+            return _compact_array(
+                event.model_dump_json(exclude_none=self.exclude_none) for event in events
+            )
         data = [event.model_dump(exclude_none=self.exclude_none) for event in events]
-        if self.pretty:
-            return json.dumps(data, indent=self.indent, ensure_ascii=False)
-        return json.dumps(data, ensure_ascii=False)
+        return json.dumps(data, indent=self.indent, ensure_ascii=False)
 
     def format_jsonlines(self, events: List["CloudEvent[Any]"]) -> str:
         """
@@ -133,11 +140,9 @@ class JsonFormatter(CloudEventsFormatter):
             {"specversion":"1.0","type":"..."}
             {"specversion":"1.0","type":"..."}
         """
-        lines = []
-        for event in events:
-            data = event.model_dump(exclude_none=self.exclude_none)
-            lines.append(json.dumps(data, ensure_ascii=False))
-        return "\n".join(lines)
+        return "\n".join(
+            event.model_dump_json(exclude_none=self.exclude_none) for event in events
+        )
 
 
 class StructuredFormatter(CloudEventsFormatter):
@@ -182,17 +187,17 @@ class StructuredFormatter(CloudEventsFormatter):
 
     def format(self, event: "CloudEvent[Any]") -> str:
         """Format event as structured CloudEvents JSON."""
+        if not self.pretty:
+            return event.model_dump_json(exclude_none=True)
         data = event.model_dump(exclude_none=True)
-        if self.pretty:
-            return json.dumps(data, indent=self.indent, ensure_ascii=False)
-        return json.dumps(data, ensure_ascii=False)
+        return json.dumps(data, indent=self.indent, ensure_ascii=False)
 
     def format_batch(self, events: List["CloudEvent[Any]"]) -> str:
         """Format events as JSON array of structured CloudEvents."""
+        if not self.pretty:
+            return _compact_array(event.model_dump_json(exclude_none=True) for event in events)
         data = [event.model_dump(exclude_none=True) for event in events]
-        if self.pretty:
-            return json.dumps(data, indent=self.indent, ensure_ascii=False)
-        return json.dumps(data, ensure_ascii=False)
+        return json.dumps(data, indent=self.indent, ensure_ascii=False)
 
 
 class BinaryFormatter:
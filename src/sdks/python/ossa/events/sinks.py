@@ -85,7 +85,7 @@ class HttpSinkConfig(BaseModel):
     timeout: int = Field(default=30, ge=1, description="Request timeout in seconds")
     mode: str = Field(
         default="structured",
-        description="CloudEvents mode: 'structured' or 'binary'",
+        description="CloudEvents mode: 'structured', 'binary' or 'batch'",
     )
 
     class Config:
@@ -104,9 +104,10 @@ class HttpSink(CloudEventsSink):
     """
     HTTP sink - sends events to HTTP endpoint.
 
-    Supports both CloudEvents modes:
+    Supports the CloudEvents HTTP content modes:
     - Structured: Event as JSON body with application/cloudevents+json
     - Binary: Data as body with CloudEvents attributes in HTTP headers
+    - Batch: All events in one JSON array with application/cloudevents-batch+json
 
     Example:
         >>> from ossa.events import CloudEventsEmitter, HttpSink
@@ -133,7 +134,7 @@ class HttpSink(CloudEventsSink):
             url: HTTP endpoint URL
             headers: Additional HTTP headers (optional)
             timeout: Request timeout in seconds (default: 30)
-            mode: CloudEvents mode - "structured" or "binary" (default: "structured")
+            mode: CloudEvents mode - "structured", "binary" or "batch" (default: "structured")
         """
         self.config = HttpSinkConfig(
             url=url,
@@ -141,31 +142,46 @@ class HttpSink(CloudEventsSink):
             timeout=timeout,
             mode=mode,
         )
+        self._session: Optional[Any] = None
+
+    def _get_session(self) -> Any:
+        """Get or create the HTTP session (connections are kept alive across sends)."""
+        if self._session is None:
+            try:
+                import requests
+            except ImportError:
+                raise ImportError(
+                    "requests package required for HTTP sink. "
+                    "Install with: pip install requests"
+                )
+
+            self._session = requests.Session()
+
+        return self._session
 
     def send(self, events: list["CloudEvent[Any]"]) -> None:
         """Send events to HTTP endpoint."""
-        try:
-            import requests
-        except ImportError:
-            raise ImportError(
-                "requests package required for HTTP sink. "
-                "Install with: pip install requests"
-            )
+        session = self._get_session()
+
+        if self.config.mode == "batch":
+            if events:
+                self._send_batch(events, session)
+            return
 
         for event in events:
             if self.config.mode == "structured":
-                self._send_structured(event, requests)
+                self._send_structured(event, session)
             else:
-                self._send_binary(event, requests)
+                self._send_binary(event, session)
 
-    def _send_structured(self, event: "CloudEvent[Any]", requests: Any) -> None:
+    def _send_structured(self, event: "CloudEvent[Any]", session: Any) -> None:
         """Send event in structured mode (JSON body)."""
         headers = {
             "Content-Type": "application/cloudevents+json",
             **self.config.headers,
         }
 
-        response = requests.post(
+        response = session.post(
             self.config.url,
             json=event.model_dump(exclude_none=True),
             headers=headers,
@@ -173,7 +189,22 @@ class HttpSink(CloudEventsSink):
         )
         response.raise_for_status()
 
-    def _send_binary(self, event: "CloudEvent[Any]", requests: Any) -> None:
+    def _send_batch(self, events: list["CloudEvent[Any]"], session: Any) -> None:
+        """Send all events in a single request (batched content mode)."""
+        headers = {
+            "Content-Type": "application/cloudevents-batch+json",
+            **self.config.headers,
+        }
+
+        response = session.post(
+            self.config.url,
+            json=[event.model_dump(exclude_none=True) for event in events],
+            headers=headers,
+            timeout=self.config.timeout,
+        )
+        response.raise_for_status()
+
+    def _send_binary(self, event: "CloudEvent[Any]", session: Any) -> None:
         """Send event in binary mode (headers + data body)."""
         headers = {
             "ce-specversion": event.specversion,
@@ -200,7 +231,7 @@ class HttpSink(CloudEventsSink):
         if event.ossaspanid:
             headers["ce-ossaspanid"] = event.ossaspanid
 
-        response = requests.post(
+        response = session.post(
             self.config.url,
             json=event.data,
             headers=headers,
@@ -208,6 +239,12 @@ class HttpSink(CloudEventsSink):
         )
         response.raise_for_status()
 
+    def close(self) -> None:
+        """Close HTTP session."""
+        if self._session:
+            self._session.close()
+            self._session = None
+
 
 class KafkaSinkConfig(BaseModel):
     """Configuration for Kafka sink."""
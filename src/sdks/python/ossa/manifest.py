@@ -6,6 +6,13 @@ import yaml
 
 from .exceptions import OSSAError
 
+# Prefer PyYAML's libyaml bindings; fall back to the pure-Python classes
+# when PyYAML was built without libyaml.
+try:
+    from yaml import CSafeDumper as YamlDumper, CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper as YamlDumper, SafeLoader as YamlLoader
+
 
 class Manifest:
     """OSSA Manifest wrapper with fluent interface."""
@@ -64,7 +71,8 @@ class Manifest:
         return self._data.copy()
 
     def to_yaml(self) -> str:
-        return yaml.dump(self._data, default_flow_style=False, sort_keys=False)
+        """Serialize to YAML; only plain YAML types (no Python-specific tags) are supported."""
+        return yaml.dump(self._data, Dumper=YamlDumper, default_flow_style=False, sort_keys=False)
 
     def to_json(self) -> str:
         import json
@@ -93,19 +101,22 @@ class Manifest:
 def load_manifest(path: Union[str, Path]) -> Manifest:
     """Load manifest from file."""
     path = Path(path)
-    if not path.exists():
-        raise OSSAError(f"File not found: {path}")
-
     try:
         content = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        raise OSSAError(f"File not found: {path}") from None
+    except OSError as e:
+        raise OSSAError(f"Failed to load manifest: {e}") from e
+
+    try:
         if path.suffix in (".yaml", ".yml"):
-            data = yaml.safe_load(content)
+            data = yaml.load(content, Loader=YamlLoader)
         elif path.suffix == ".json":
             import json
             data = json.loads(content)
         else:
             try:
-                data = yaml.safe_load(content)
+                data = yaml.load(content, Loader=YamlLoader)
             except yaml.YAMLError:
                 import json
                 data = json.loads(content)
@@ -362,14 +362,25 @@ ossa generate client openapi.yaml
 
         agent_path = Path(agent_dir)
 
+        # One directory listing instead of a stat() per required entry.
+        # Dangling symlinks don't count, and names absent from the listing
+        # fall back to exists() so case-insensitive filesystems still match.
+        try:
+            with os.scandir(agent_dir) as it:
+                present = {
+                    entry.name
+                    for entry in it
+                    if not entry.is_symlink() or os.path.exists(entry.path)
+                }
+        except OSError:
+            present = set()
+
         for dir_name in required_dirs:
-            dir_path = agent_path / dir_name
-            if not dir_path.exists():
+            if dir_name not in present and not (agent_path / dir_name).exists():
                 errors.append(f"Missing directory: {dir_name}")
 
         for file_name in required_files:
-            file_path = agent_path / file_name
-            if not file_path.exists():
+            if file_name not in present and not (agent_path / file_name).exists():
                 errors.append(f"Missing file: {file_name}")
 
         return {"valid": len(errors) == 0, "errors": errors}
@@ -6,6 +6,7 @@ sequential step execution with conditional logic, retries, and error handling.
 """
 
 import asyncio
+import re
 import time
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Union
@@ -15,6 +16,9 @@ from pydantic import BaseModel
 from .exceptions import ConfigurationError, OSSAError
 from .types import OSSAManifest, TaskSpec, TaskStep
 
+# ${variable_name} references in step parameters
+_VARIABLE_RE = re.compile(r"\$\{([a-zA-Z_][a-zA-Z0-9_]*)\}")
+
 
 class TaskResponse(BaseModel):
     """
@@ -176,7 +180,7 @@ class TaskRunner:
             ... else:
             ...     print(f"Errors: {response.errors}")
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         parameters = parameters or {}
 
         # Initialize execution context
@@ -199,7 +203,7 @@ class TaskRunner:
             context.current_step = idx
 
             # Check timeout
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
             if elapsed > timeout:
                 errors.append(f"Task timeout after {elapsed:.2f}s")
                 break
@@ -227,7 +231,7 @@ class TaskRunner:
                     break
 
         # Calculate duration
-        duration_ms = (time.time() - start_time) * 1000
+        duration_ms = (time.perf_counter() - start_time) * 1000
 
         # Determine status
         if steps_completed == len(self.spec.steps):
@@ -266,8 +270,7 @@ class TaskRunner:
         """
         # For now, run synchronously in a thread pool
         # Future: Implement proper async step execution
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, lambda: self.run(parameters))
+        return await asyncio.to_thread(self.run, parameters)
 
     def _execute_step(self, step: TaskStep, context: TaskContext) -> Any:
         """
@@ -345,18 +348,16 @@ class TaskRunner:
         Returns:
             Resolved parameters
         """
-        import re
-
         resolved: Dict[str, Any] = {}
 
-        for key, value in parameters.items():
+        for key, value in (parameters or {}).items():
             if isinstance(value, str):
                 # Substitute ${variable} patterns
                 def replace_var(match: re.Match[str]) -> str:
                     var_name = match.group(1)
                     return str(context.get(var_name, match.group(0)))
 
-                resolved[key] = re.sub(r"\$\{([a-zA-Z_][a-zA-Z0-9_]*)\}", replace_var, value)
+                resolved[key] = _VARIABLE_RE.sub(replace_var, value)
             else:
                 resolved[key] = value
 
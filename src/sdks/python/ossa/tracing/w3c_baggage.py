@@ -19,10 +19,14 @@ Thread Safety: W3CBaggage instances are NOT thread-safe. Create new instances
 per request/agent interaction.
 """
 
+import sys
 from typing import Dict, Optional, List, Tuple
 from dataclasses import dataclass, field
 from urllib.parse import quote, unquote
 
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 # Exceptions
 class BaggageError(Exception):
@@ -41,7 +45,7 @@ class BaggageParseError(BaggageError):
 
 
 # Data models
-@dataclass
+@dataclass(**_SLOTS)
 class BaggageEntry:
     """
     A single baggage entry with key, value, and optional metadata.
@@ -126,6 +130,8 @@ class W3CBaggage:
         >>> assert parsed.get("ossa.agent_id") == "agent-001"
     """
 
+    __slots__ = ("_entries",)
+
     OSSA_PREFIX = "ossa."
     HEADER_NAME = "baggage"
     MAX_PAIRS = 180
@@ -440,16 +446,16 @@ class W3CBaggage:
             >>> assert merged.get("key1") == "value1"
             >>> assert merged.get("key2") == "value2"
         """
-        merged = W3CBaggage()
-
-        # Copy entries from self
-        for entry in self._entries.values():
-            merged.set(entry.key, entry.value, entry.metadata)
-
-        # Copy entries from other (overwrites conflicts)
-        for entry in other._entries.values():
-            merged.set(entry.key, entry.value, entry.metadata)
+        # Entries are replaced rather than mutated, so both sides' entry
+        # objects can be shared instead of re-created (other wins on conflict)
+        entries = {**self._entries, **other._entries}
+        if len(entries) > self.MAX_PAIRS:
+            raise BaggageSizeError(
+                f"Baggage exceeds maximum pairs ({self.MAX_PAIRS})"
+            )
 
+        merged = W3CBaggage()
+        merged._entries = entries
         return merged
 
     def __repr__(self) -> str:
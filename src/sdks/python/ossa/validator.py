@@ -1,14 +1,65 @@
 """OSSA Validator - Validate OSSA manifests against the schema."""
 
 import re
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, Optional, Union, cast
 
 import yaml
 
 from .exceptions import ValidationError
 
+# Same libyaml preference as the manifest loader.
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as YamlLoader
+
+# Loaded schema documents, keyed by resolved path. Entries are LRU-ordered and
+# re-read from disk once they are older than the refresh interval.
+SCHEMA_CACHE_MAXSIZE = 32
+SCHEMA_CACHE_TTL_SECONDS = 300.0
+
+_schema_cache: "OrderedDict[Path, tuple[float, dict[str, Any]]]" = OrderedDict()
+_schema_cache_lock = threading.Lock()
+
+
+def _read_schema(path: Path) -> Optional[dict[str, Any]]:
+    try:
+        content = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+    if path.suffix in (".yaml", ".yml"):
+        return cast(dict[str, Any], yaml.load(content, Loader=YamlLoader))
+    import json
+    return cast(dict[str, Any], json.loads(content))
+
+
+def _cached_schema(path: Union[str, Path]) -> Optional[dict[str, Any]]:
+    """Return the shared cached schema document; callers must not mutate it."""
+    key = Path(path).resolve()
+    now = time.monotonic()
+    with _schema_cache_lock:
+        entry = _schema_cache.get(key)
+        if entry is not None and now - entry[0] < SCHEMA_CACHE_TTL_SECONDS:
+            _schema_cache.move_to_end(key)
+            return entry[1]
+
+    schema = _read_schema(key)
+
+    with _schema_cache_lock:
+        if schema is None:
+            _schema_cache.pop(key, None)
+            return None
+        _schema_cache[key] = (now, schema)
+        _schema_cache.move_to_end(key)
+        while len(_schema_cache) > SCHEMA_CACHE_MAXSIZE:
+            _schema_cache.popitem(last=False)
+    return schema
+
 
 @dataclass
 class ValidationResult:
@@ -35,26 +86,32 @@ class Validator:
 
     def __init__(self, schema_path: Optional[Union[str, Path]] = None):
         self._schema: Optional[dict[str, Any]] = None
+        self._schema_validator: Any = None
         if schema_path:
             self._load_schema(Path(schema_path))
 
     def _load_schema(self, path: Path) -> None:
-        if not path.exists():
-            return
-        content = path.read_text(encoding="utf-8")
-        if path.suffix in (".yaml", ".yml"):
-            self._schema = yaml.safe_load(content)
-        else:
-            import json
-            self._schema = json.loads(content)
+        self._schema = _cached_schema(path)
+        self._schema_validator = None
+
+    def _get_schema_validator(self) -> Any:
+        """Build the JSON Schema validator once; the schema is checked on first use."""
+        if self._schema_validator is None:
+            import jsonschema
+
+            cls = jsonschema.validators.validator_for(self._schema)
+            cls.check_schema(self._schema)
+            self._schema_validator = cls(self._schema)
+        return self._schema_validator
 
     def validate(self, manifest: Any) -> ValidationResult:
         """Validate a manifest."""
         errors: list[str] = []
         warnings: list[str] = []
 
-        if hasattr(manifest, "to_dict"):
-            data = manifest.to_dict()
+        to_dict = getattr(manifest, "to_dict", None)
+        if to_dict is not None:
+            data = to_dict()
         elif isinstance(manifest, dict):
             data = manifest
         else:
@@ -85,7 +142,11 @@ class Validator:
         if self._schema and not errors:
             try:
                 import jsonschema
-                jsonschema.validate(data, self._schema)
+                error = jsonschema.exceptions.best_match(
+                    self._get_schema_validator().iter_errors(data)
+                )
+                if error is not None:
+                    errors.append(f"Schema validation: {error}")
             except Exception as e:
                 errors.append(f"Schema validation: {e}")
 
@@ -7,7 +7,10 @@ parallel execution, and error handling.
 """
 
 import asyncio
+import contextvars
+import re
 import time
+from concurrent.futures import ALL_COMPLETED, FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Set, Union
 
@@ -16,6 +19,9 @@ from pydantic import BaseModel
 from .exceptions import ConfigurationError, OSSAError
 from .types import OSSAManifest, WorkflowSpec, WorkflowStep
 
+# ${variable_name} and ${step_name.field} references in step parameters
+_VARIABLE_RE = re.compile(r"\$\{([a-zA-Z_][a-zA-Z0-9_.]*)\}")
+
 
 class WorkflowResponse(BaseModel):
     """
@@ -136,9 +142,12 @@ class WorkflowRunner:
                 - timeout: Override workflow timeout (seconds)
                 - parallel: Override parallel execution flag
                 - continue_on_error: Continue executing steps after errors
+                - max_concurrency: Maximum steps in flight at once; only applies
+                  in parallel mode (default: the thread pool default)
 
         Raises:
-            ConfigurationError: If manifest is invalid or missing required fields
+            ConfigurationError: If manifest is invalid or missing required fields,
+                or max_concurrency is not a positive integer
 
         Example:
             >>> workflow = WorkflowRunner(manifest, timeout=600, parallel=True)
@@ -159,6 +168,16 @@ class WorkflowRunner:
         self.spec: WorkflowSpec = manifest.spec  # type: ignore
         self.runtime_options = runtime_options
 
+        max_concurrency = runtime_options.get("max_concurrency")
+        if max_concurrency is not None and (
+            not isinstance(max_concurrency, int)
+            or isinstance(max_concurrency, bool)
+            or max_concurrency < 1
+        ):
+            raise ConfigurationError(
+                f"max_concurrency must be a positive integer, got {max_concurrency!r}"
+            )
+
         # Validate steps
         if not self.spec.steps or len(self.spec.steps) == 0:
             raise ConfigurationError("Workflow must have at least one step")
@@ -173,13 +192,15 @@ class WorkflowRunner:
         Raises:
             ConfigurationError: If dependencies are invalid or contain cycles
         """
-        step_names = {step.name for step in self.spec.steps}
+        steps_by_name: Dict[str, WorkflowStep] = {}
+        for step in self.spec.steps:
+            steps_by_name.setdefault(step.name, step)
 
         for step in self.spec.steps:
             if step.depends_on:
                 # Check that all dependencies exist
                 for dep in step.depends_on:
-                    if dep not in step_names:
+                    if dep not in steps_by_name:
                         raise ConfigurationError(
                             f"Step '{step.name}' depends on unknown step '{dep}'"
                         )
@@ -192,8 +213,7 @@ class WorkflowRunner:
             visited.add(step_name)
             rec_stack.add(step_name)
 
-            # Find step
-            step = next((s for s in self.spec.steps if s.name == step_name), None)
+            step = steps_by_name.get(step_name)
             if step and step.depends_on:
                 for dep in step.depends_on:
                     if dep not in visited:
@@ -214,6 +234,14 @@ class WorkflowRunner:
         """
         Execute the workflow with given parameters (synchronous).
 
+        In parallel mode the timeout bounds how long run() waits, not the steps
+        themselves: steps still running when it expires (or when a failure
+        ends the run without continue_on_error) are dropped from the response
+        but keep running in their worker threads until they finish, and the
+        interpreter waits for them at exit. Without continue_on_error, steps
+        that finish at the same moment as the first failure may or may not be
+        recorded.
+
         Args:
             parameters: Input parameters for the workflow (available to all steps)
 
@@ -231,7 +259,7 @@ class WorkflowRunner:
             ... else:
             ...     print(f"Errors: {response.errors}")
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         parameters = parameters or {}
 
         # Initialize execution context
@@ -260,7 +288,7 @@ class WorkflowRunner:
             )
 
         # Calculate duration
-        duration_ms = (time.time() - start_time) * 1000
+        duration_ms = (time.perf_counter() - start_time) * 1000
 
         # Determine status
         steps_completed = len(context.completed_steps)
@@ -301,8 +329,7 @@ class WorkflowRunner:
         """
         # For now, run synchronously in a thread pool
         # Future: Implement proper async step execution
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, lambda: self.run(parameters))
+        return await asyncio.to_thread(self.run, parameters)
 
     def _has_dependencies(self) -> bool:
         """Check if any step has dependencies."""
@@ -325,28 +352,33 @@ class WorkflowRunner:
         Returns:
             Tuple of (execution_order, results, errors)
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         execution_order: List[str] = []
         results: Dict[str, Any] = {}
         errors: List[str] = []
 
-        # Build execution queue (topological sort)
-        remaining_steps = list(self.spec.steps)
-
-        while remaining_steps:
+        # Build execution queue (topological sort). Each step tracks how many
+        # of its dependencies are still outstanding, so completing a step only
+        # touches its direct dependents instead of rescanning every step.
+        steps = self.spec.steps
+        unmet: List[int] = []
+        dependents: Dict[str, List[int]] = {step.name: [] for step in steps}
+        for idx, step in enumerate(steps):
+            deps = set(step.depends_on or ())
+            unmet.append(len(deps))
+            for dep in deps:
+                dependents[dep].append(idx)
+
+        ready = [idx for idx, count in enumerate(unmet) if count == 0]
+        remaining = len(steps)
+
+        while remaining:
             # Check timeout
-            if (time.time() - start_time) > timeout:
+            if (time.perf_counter() - start_time) > timeout:
                 errors.append("Workflow timeout exceeded")
                 break
 
-            # Find steps that can be executed (dependencies met)
-            ready_steps = [
-                step
-                for step in remaining_steps
-                if context.are_dependencies_met(step.depends_on)
-            ]
-
-            if not ready_steps:
+            if not ready:
                 # No steps ready - check if blocked by failures
                 if context.failed_steps:
                     errors.append("Workflow blocked by failed dependencies")
@@ -355,23 +387,33 @@ class WorkflowRunner:
                 break
 
             # Execute ready steps
-            for step in ready_steps:
+            next_ready: List[int] = []
+            for idx in ready:
+                step = steps[idx]
+                remaining -= 1
                 try:
                     step_result = self._execute_step(step, context)
                     results[step.name] = step_result
                     context.set_step_output(step.name, step_result)
                     execution_order.append(step.name)
-                    remaining_steps.remove(step)
 
                 except Exception as e:
                     error_msg = f"Step '{step.name}' failed: {e}"
                     errors.append(error_msg)
                     results[step.name] = {"error": str(e)}
                     context.mark_step_failed(step.name)
-                    remaining_steps.remove(step)
 
                     if not continue_on_error:
                         return execution_order, results, errors
+                    continue
+
+                for dependent in dependents[step.name]:
+                    unmet[dependent] -= 1
+                    if unmet[dependent] == 0:
+                        next_ready.append(dependent)
+
+            # Keep declaration order within each wave
+            ready = sorted(next_ready)
 
         return execution_order, results, errors
 
@@ -392,9 +434,52 @@ class WorkflowRunner:
         Returns:
             Tuple of (execution_order, results, errors)
         """
-        # For now, execute sequentially
-        # Future: Implement true parallel execution with thread pool
-        return self._execute_sequential(context, timeout, continue_on_error)
+        start_time = time.perf_counter()
+        execution_order: List[str] = []
+        results: Dict[str, Any] = {}
+        errors: List[str] = []
+
+        steps = self.spec.steps
+        executor = ThreadPoolExecutor(
+            max_workers=self.runtime_options.get("max_concurrency"),
+            thread_name_prefix="ossa-workflow",
+        )
+        try:
+            # Each step runs in a copy of the caller's context so trace context
+            # (contextvars) is visible inside the worker threads.
+            futures = [
+                executor.submit(contextvars.copy_context().run, self._execute_step, step, context)
+                for step in steps
+            ]
+            done, not_done = wait(
+                futures,
+                timeout=max(0.0, timeout - (time.perf_counter() - start_time)),
+                return_when=ALL_COMPLETED if continue_on_error else FIRST_EXCEPTION,
+            )
+        finally:
+            # Don't block on steps still running after a timeout or failure;
+            # they are not interrupted and run to completion in the background
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        # Collect outcomes in declaration order
+        for step, future in zip(steps, futures):
+            if future not in done:
+                continue
+            try:
+                step_result = future.result()
+            except Exception as e:
+                errors.append(f"Step '{step.name}' failed: {e}")
+                results[step.name] = {"error": str(e)}
+                context.mark_step_failed(step.name)
+            else:
+                results[step.name] = step_result
+                context.set_step_output(step.name, step_result)
+                execution_order.append(step.name)
+
+        if not_done and (continue_on_error or not context.failed_steps):
+            errors.append("Workflow timeout exceeded")
+
+        return execution_order, results, errors
 
     def _execute_step(self, step: WorkflowStep, context: WorkflowContext) -> Any:
         """
@@ -477,11 +562,9 @@ class WorkflowRunner:
         Returns:
             Resolved parameters
         """
-        import re
-
         resolved: Dict[str, Any] = {}
 
-        for key, value in parameters.items():
+        for key, value in (parameters or {}).items():
             if isinstance(value, str):
                 # Substitute ${variable} patterns
                 def replace_var(match: re.Match[str]) -> str:
@@ -497,7 +580,7 @@ class WorkflowRunner:
                         # Simple variable reference
                         return str(context.variables.get(var_path, match.group(0)))
 
-                resolved[key] = re.sub(r"\$\{([a-zA-Z_][a-zA-Z0-9_.]*)\}", replace_var, value)
+                resolved[key] = _VARIABLE_RE.sub(replace_var, value)
             else:
                 resolved[key] = value
 
@@ -0,0 +1,148 @@
+"""
+Unit tests for OSSA agent execution.
+"""
+
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Any, Iterator, List, Optional
+
+import pytest
+
+from ossa import agent as agent_module
+from ossa.agent import AgentRunner, _shared_client
+from ossa.exceptions import OSSAError
+from ossa.types import AgentSpec, LLMConfig, Metadata
+
+
+class FakeClient:
+    """Stand-in provider client that records its API key."""
+
+    def __init__(self, api_key: Optional[str] = None) -> None:
+        self.api_key = api_key
+
+
+class FakeAnthropicClient:
+    """Stand-in Anthropic client whose streams yield fixed text pieces."""
+
+    def __init__(self, pieces: List[str], error: Optional[Exception] = None) -> None:
+        self.pieces = pieces
+        self.error = error
+        self.closed = False
+        self.messages = SimpleNamespace(stream=self._stream)
+
+    def _text_stream(self) -> Iterator[str]:
+        if self.error:
+            raise self.error
+        yield from self.pieces
+
+    @contextmanager
+    def _stream(self, **kwargs: Any) -> Iterator[Any]:
+        try:
+            yield SimpleNamespace(text_stream=self._text_stream())
+        finally:
+            self.closed = True
+
+
+class FakeOpenAIClient:
+    """Stand-in OpenAI client whose completions stream fixed text pieces."""
+
+    def __init__(self, pieces: List[str]) -> None:
+        self.pieces = pieces
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, **kwargs: Any) -> Iterator[Any]:
+        for piece in self.pieces:
+            delta = SimpleNamespace(content=piece)
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+
+def make_agent(provider: str, client: Any) -> AgentRunner:
+    """Build an agent runner that talks to the given fake client."""
+    manifest = SimpleNamespace(
+        is_agent=True,
+        metadata=Metadata(name="test-agent", version="1.0.0"),
+        spec=AgentSpec(role="You are helpful", llm=LLMConfig(provider=provider, model="test-model")),
+    )
+    runner = AgentRunner(manifest)  # type: ignore[arg-type]
+    runner._client = client
+    return runner
+
+
+@pytest.fixture(autouse=True)
+def _isolated_client_cache() -> Any:
+    agent_module._shared_clients.clear()
+    yield
+    agent_module._shared_clients.clear()
+
+
+class TestSharedClient:
+    """Tests for the shared LLM client cache."""
+
+    def test_client_shared_per_key(self) -> None:
+        """Test runners with the same explicit key share one client."""
+        first = _shared_client(FakeClient, "key-1")
+
+        assert _shared_client(FakeClient, "key-1") is first
+        assert _shared_client(FakeClient, "key-2") is not first
+
+    def test_client_without_key_not_shared(self) -> None:
+        """Test environment-keyed clients are created fresh and never cached."""
+        first = _shared_client(FakeClient, None)
+
+        assert _shared_client(FakeClient, None) is not first
+        assert len(agent_module._shared_clients) == 0
+
+    def test_cache_evicts_least_recently_used(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the cache stays within its size bound."""
+        monkeypatch.setattr(agent_module, "SHARED_CLIENT_MAXSIZE", 2)
+        first = _shared_client(FakeClient, "key-1")
+        _shared_client(FakeClient, "key-2")
+        _shared_client(FakeClient, "key-1")
+        _shared_client(FakeClient, "key-3")
+
+        assert [key for _, key in agent_module._shared_clients] == ["key-1", "key-3"]
+        assert _shared_client(FakeClient, "key-1") is first
+
+
+class TestStream:
+    """Tests for streaming agent execution."""
+
+    @pytest.mark.parametrize(
+        "provider, client_cls", [("anthropic", FakeAnthropicClient), ("openai", FakeOpenAIClient)]
+    )
+    def test_stream_yields_chunks_and_records_reply(self, provider: str, client_cls: Any) -> None:
+        """Test streamed chunks are yielded in order and the reply lands in history."""
+        runner = make_agent(provider, client_cls(["Hel", "lo", "!"]))
+
+        chunks = list(runner.stream("Hi"))
+
+        assert chunks == ["Hel", "lo", "!"]
+        assert runner.history.messages[1:] == [
+            {"role": "user", "content": "Hi"},
+            {"role": "assistant", "content": "Hello!"},
+        ]
+        assert runner.get_request_count() == 1
+
+    def test_early_stop_records_partial_reply(self) -> None:
+        """Test closing the stream early keeps turns paired and releases the provider stream."""
+        client = FakeAnthropicClient(["Hel", "lo", "!"])
+        runner = make_agent("anthropic", client)
+
+        for chunk in runner.stream("Hi"):
+            break
+
+        assert client.closed
+        assert runner.history.messages[1:] == [
+            {"role": "user", "content": "Hi"},
+            {"role": "assistant", "content": "Hel"},
+        ]
+        assert runner.get_request_count() == 0
+
+    def test_failure_before_any_text_drops_user_turn(self) -> None:
+        """Test a provider error with no text received leaves no dangling user turn."""
+        runner = make_agent("anthropic", FakeAnthropicClient([], error=RuntimeError("boom")))
+
+        with pytest.raises(OSSAError, match="boom"):
+            list(runner.stream("Hi"))
+
+        assert [m["role"] for m in runner.history.messages] == ["system"]
@@ -0,0 +1,30 @@
+"""
+Unit tests for OSSA agent card generation.
+"""
+
+from ossa.agent_card import generate_agent_card
+
+
+class TestCapabilities:
+    """Tests for capability extraction."""
+
+    def test_capabilities_deduplicated_in_order(self) -> None:
+        """Test labels, tags and spec capabilities merge without duplicates."""
+        card = generate_agent_card(
+            {
+                "metadata": {
+                    "name": "test-agent",
+                    "labels": {"capability": "search, summarize"},
+                    "tags": ["summarize", "translate"],
+                },
+                "spec": {"capabilities": [{"id": "translate"}, {"name": "review"}, 7, 7]},
+            }
+        )
+
+        assert card["capabilities"] == ["search", "summarize", "translate", "review", "7"]
+
+    def test_non_string_tags(self) -> None:
+        """Test unhashable tags are stringified instead of failing card generation."""
+        card = generate_agent_card({"metadata": {"name": "test-agent", "tags": [["x"], ["x"]]}})
+
+        assert card["capabilities"] == ["['x']"]
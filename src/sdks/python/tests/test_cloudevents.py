@@ -111,6 +111,20 @@ class TestCloudEvent:
 class TestCloudEventsEmitter:
     """Test CloudEventsEmitter."""
 
+    def test_generated_time_is_utc(self):
+        """Test generated event time is a current RFC 3339 UTC timestamp."""
+        emitter = CloudEventsEmitter(source="ossa/test", sink=StdoutSink(file=io.StringIO()))
+
+        before = datetime.now(timezone.utc)
+        first = emitter.emit("dev.ossa.test", {})
+        second = emitter.emit("dev.ossa.test", {})
+        after = datetime.now(timezone.utc)
+
+        for event in (first, second):
+            assert event.time.endswith("+00:00")
+            parsed = datetime.fromisoformat(event.time)
+            assert before <= parsed <= after
+
     def test_basic_emit(self):
         """Test basic event emission."""
         output = io.StringIO()
@@ -282,6 +296,26 @@ class TestStdoutSink:
         parsed = json.loads(content)
         assert parsed["type"] == "dev.ossa.test"
 
+    def test_compact_output_escapes_non_ascii(self):
+        """Test compact output keeps ASCII-escaped JSON lines."""
+        output = io.StringIO()
+        sink = StdoutSink(pretty=False, file=output)
+
+        event = CloudEvent[dict[str, str]](
+            type="dev.ossa.test",
+            source="ossa/test",
+            id="test-123",
+            data={"status": "café"},
+        )
+
+        sink.send([event])
+
+        assert output.getvalue() == (
+            '{"specversion": "1.0", "type": "dev.ossa.test", "source": "ossa/test", '
+            '"id": "test-123", "datacontenttype": "application/json", '
+            '"data": {"status": "caf\\u00e9"}}\n'
+        )
+
     def test_pretty_output(self):
         """Test pretty-printed JSON output."""
         output = io.StringIO()
@@ -306,7 +340,7 @@ class TestStdoutSink:
 class TestHttpSink:
     """Test HttpSink."""
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_structured_mode(self, mock_post):
         """Test HTTP sink in structured mode."""
         mock_response = Mock()
@@ -335,7 +369,34 @@ class TestHttpSink:
         assert call_args[1]["headers"]["Authorization"] == "Bearer token123"
         assert call_args[1]["json"]["type"] == "dev.ossa.test"
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
+    def test_batch_mode(self, mock_post):
+        """Test HTTP sink sends one request per batch in batch mode."""
+        mock_response = Mock()
+        mock_response.raise_for_status = Mock()
+        mock_post.return_value = mock_response
+
+        sink = HttpSink(url="https://events.example.com/webhook", mode="batch")
+
+        events = [
+            CloudEvent[dict[str, int]](
+                type="dev.ossa.test",
+                source="ossa/test",
+                id=f"test-{i}",
+                data={"i": i},
+            )
+            for i in range(3)
+        ]
+
+        sink.send(events)
+        sink.send([])
+
+        mock_post.assert_called_once()
+        call_args = mock_post.call_args
+        assert call_args[1]["headers"]["Content-Type"] == "application/cloudevents-batch+json"
+        assert [e["id"] for e in call_args[1]["json"]] == ["test-0", "test-1", "test-2"]
+
+    @patch("requests.Session.post")
     def test_binary_mode(self, mock_post):
         """Test HTTP sink in binary mode."""
         mock_response = Mock()
@@ -366,7 +427,7 @@ class TestHttpSink:
         assert headers["ce-id"] == "test-123"
         assert headers["ce-time"] == "2024-01-27T12:00:00Z"
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_binary_mode_with_extensions(self, mock_post):
         """Test binary mode includes OSSA extensions."""
         mock_response = Mock()
@@ -390,6 +451,28 @@ class TestHttpSink:
         assert headers["ce-ossaagentid"] == "my-agent"
         assert headers["ce-ossatraceid"] == "trace-abc"
 
+    @patch("requests.Session.post")
+    def test_session_reused(self, mock_post):
+        """Test HTTP sink reuses one session across sends."""
+        mock_post.return_value = Mock()
+
+        sink = HttpSink(url="https://events.example.com/webhook")
+        event = CloudEvent[dict[str, str]](
+            type="dev.ossa.test",
+            source="ossa/test",
+            id="test-123",
+        )
+
+        sink.send([event])
+        session = sink._session
+        sink.send([event])
+
+        assert mock_post.call_count == 2
+        assert sink._session is session
+
+        sink.close()
+        assert sink._session is None
+
 
 class TestKafkaSink:
     """Test KafkaSink."""
@@ -465,6 +548,25 @@ class TestFormatters:
         parsed = json.loads(result)
         assert parsed["type"] == "dev.ossa.test"
 
+    def test_compact_output_is_consistent(self):
+        """Test compact single-event and batch output share one serialization."""
+        event = CloudEvent[dict[str, str]](
+            type="dev.ossa.test",
+            source="ossa/test",
+            id="test-123",
+            data={"status": "café"},
+        )
+        expected = (
+            '{"specversion":"1.0","type":"dev.ossa.test","source":"ossa/test",'
+            '"id":"test-123","datacontenttype":"application/json","data":{"status":"café"}}'
+        )
+
+        for formatter in (JsonFormatter(pretty=False), StructuredFormatter(pretty=False)):
+            assert formatter.format(event) == expected
+            assert formatter.format_batch([event, event]) == f"[{expected},{expected}]"
+            assert formatter.format_batch([]) == "[]"
+        assert JsonFormatter().format_jsonlines([event, event]) == f"{expected}\n{expected}"
+
     def test_json_formatter_pretty(self):
         """Test JSON formatter in pretty mode."""
         formatter = JsonFormatter(pretty=True, indent=2)
@@ -631,7 +733,7 @@ class TestIntegration:
 
     def test_error_handling(self):
         """Test error handling in sinks."""
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.side_effect = Exception("Network error")
 
             sink = HttpSink(url="https://events.example.com/webhook")
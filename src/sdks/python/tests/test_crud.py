@@ -0,0 +1,92 @@
+"""
+Unit tests for the OSSA agent CRUD API.
+"""
+
+from typing import Any, Dict, Iterator
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from ossa.crud import controller  # noqa: E402
+from ossa.crud.repository import AgentRepository  # noqa: E402
+from ossa.crud.service import AgentService  # noqa: E402
+
+
+def make_manifest(name: str, role: str = "assistant") -> Dict[str, Any]:
+    """Build a minimal agent manifest payload."""
+    return {
+        "apiVersion": "ossa/v0.4.5",
+        "kind": "Agent",
+        "metadata": {"name": name, "version": "1.0.0"},
+        "spec": {"role": role},
+    }
+
+
+@pytest.fixture
+def client() -> Iterator[TestClient]:
+    app = FastAPI()
+    app.include_router(controller.router)
+    repository = AgentRepository()
+    app.dependency_overrides[controller.get_service] = lambda: AgentService(repository)
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+class TestAgentRoutes:
+    """Tests for the agent CRUD routes."""
+
+    def test_create_and_get(self, client: TestClient) -> None:
+        """Test a created agent is returned and persists across requests."""
+        manifest = make_manifest("test-agent")
+
+        created = client.post("/api/v1/agents/", json=manifest)
+        fetched = client.get("/api/v1/agents/test-agent")
+
+        assert created.status_code == 201
+        assert created.json() == manifest
+        assert fetched.status_code == 200
+        assert fetched.json() == manifest
+
+    def test_list(self, client: TestClient) -> None:
+        """Test all created agents are listed."""
+        client.post("/api/v1/agents/", json=make_manifest("agent-a"))
+        client.post("/api/v1/agents/", json=make_manifest("agent-b"))
+
+        response = client.get("/api/v1/agents/")
+
+        assert response.status_code == 200
+        assert [agent["metadata"]["name"] for agent in response.json()] == ["agent-a", "agent-b"]
+
+    def test_update(self, client: TestClient) -> None:
+        """Test an existing agent is replaced by the new manifest."""
+        client.post("/api/v1/agents/", json=make_manifest("test-agent"))
+
+        response = client.put(
+            "/api/v1/agents/test-agent", json=make_manifest("test-agent", role="reviewer")
+        )
+
+        assert response.status_code == 200
+        assert client.get("/api/v1/agents/test-agent").json()["spec"]["role"] == "reviewer"
+
+    def test_delete(self, client: TestClient) -> None:
+        """Test a deleted agent can no longer be fetched."""
+        client.post("/api/v1/agents/", json=make_manifest("test-agent"))
+
+        assert client.delete("/api/v1/agents/test-agent").status_code == 204
+        assert client.get("/api/v1/agents/test-agent").status_code == 404
+
+    def test_invalid_manifest_rejected(self, client: TestClient) -> None:
+        """Test an invalid manifest is rejected with a client error."""
+        response = client.post("/api/v1/agents/", json={"kind": "Agent"})
+
+        assert response.status_code == 400
+        assert "Missing apiVersion" in response.json()["detail"]
+
+    def test_missing_agent(self, client: TestClient) -> None:
+        """Test unknown agents return 404."""
+        assert client.get("/api/v1/agents/missing").status_code == 404
@@ -0,0 +1,128 @@
+"""
+Unit tests for OSSA manifest validation.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from ossa import validator as validator_module
+from ossa.validator import Validator, _cached_schema
+
+
+SCHEMA = {
+    "type": "object",
+    "required": ["apiVersion", "kind"],
+}
+
+
+@pytest.fixture(autouse=True)
+def _isolated_schema_cache():
+    validator_module._schema_cache.clear()
+    yield
+    validator_module._schema_cache.clear()
+
+
+class TestSchemaCache:
+    """Tests for the schema document cache."""
+
+    def test_schema_loaded_once(self, tmp_path: Path) -> None:
+        """Test repeated loads are served from the cache, not re-read from disk."""
+        schema_path = tmp_path / "schema.json"
+        schema_path.write_text(json.dumps(SCHEMA))
+
+        first = _cached_schema(schema_path)
+        schema_path.write_text(json.dumps({"type": "string"}))
+
+        assert first == SCHEMA
+        assert _cached_schema(schema_path) is first
+        assert Validator(schema_path)._schema is first
+
+    def test_schema_refreshed_after_ttl(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test stale entries are re-read from disk."""
+        schema_path = tmp_path / "schema.json"
+        schema_path.write_text(json.dumps(SCHEMA))
+        _cached_schema(schema_path)
+
+        schema_path.write_text(json.dumps({"type": "string"}))
+        monkeypatch.setattr(validator_module, "SCHEMA_CACHE_TTL_SECONDS", 0.0)
+
+        assert _cached_schema(schema_path) == {"type": "string"}
+
+    def test_cache_evicts_least_recently_used(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the cache stays within its size bound."""
+        monkeypatch.setattr(validator_module, "SCHEMA_CACHE_MAXSIZE", 2)
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"schema{i}.json"
+            path.write_text(json.dumps(SCHEMA))
+            paths.append(path)
+            _cached_schema(path)
+
+        assert list(validator_module._schema_cache) == [p.resolve() for p in paths[1:]]
+
+    def test_missing_schema(self, tmp_path: Path) -> None:
+        """Test a missing schema file yields no schema."""
+        assert _cached_schema(tmp_path / "missing.json") is None
+        assert Validator(tmp_path / "missing.json")._schema is None
+
+
+class TestValidator:
+    """Tests for Validator."""
+
+    def test_schema_validation_errors(self, tmp_path: Path) -> None:
+        """Test JSON Schema errors are reported."""
+        schema_path = tmp_path / "schema.json"
+        schema_path.write_text(json.dumps({**SCHEMA, "required": ["apiVersion", "extra"]}))
+
+        result = Validator(schema_path).validate(
+            {
+                "apiVersion": "ossa/v0.4.5",
+                "kind": "Agent",
+                "metadata": {"name": "test-agent"},
+                "spec": {"role": "assistant"},
+            }
+        )
+
+        assert not result.valid
+        assert any("Schema validation" in error for error in result.errors)
+
+    def test_schema_validator_built_once(self, tmp_path: Path) -> None:
+        """Test the compiled schema validator is reused across manifests."""
+        schema_path = tmp_path / "schema.json"
+        schema_path.write_text(json.dumps(SCHEMA))
+        validator = Validator(schema_path)
+        manifest = {
+            "apiVersion": "ossa/v0.4.5",
+            "kind": "Agent",
+            "metadata": {"name": "test-agent"},
+            "spec": {"role": "assistant"},
+        }
+
+        assert validator.validate(manifest).valid
+        schema_validator = validator._schema_validator
+        assert schema_validator is not None
+        assert validator.validate(manifest).valid
+        assert validator._schema_validator is schema_validator
+
+    def test_invalid_schema_reported(self, tmp_path: Path) -> None:
+        """Test an invalid schema document is reported as a schema error."""
+        schema_path = tmp_path / "schema.json"
+        schema_path.write_text(json.dumps({"type": 12}))
+
+        result = Validator(schema_path).validate(
+            {
+                "apiVersion": "ossa/v0.4.5",
+                "kind": "Agent",
+                "metadata": {"name": "test-agent"},
+                "spec": {"role": "assistant"},
+            }
+        )
+
+        assert not result.valid
+        assert any("Schema validation" in error for error in result.errors)
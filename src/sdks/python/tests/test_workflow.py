@@ -0,0 +1,155 @@
+"""
+Unit tests for OSSA workflow execution.
+"""
+
+import contextvars
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+
+import pytest
+
+from ossa.exceptions import ConfigurationError
+from ossa.types import Metadata, WorkflowSpec, WorkflowStep
+from ossa.workflow import WorkflowContext, WorkflowRunner
+
+
+def make_runner(
+    delays: Dict[str, float],
+    fail: tuple = (),
+    hook: Optional[Callable[[WorkflowStep], None]] = None,
+    **runtime_options: Any,
+) -> WorkflowRunner:
+    """Build a parallel workflow whose steps sleep for the given delays."""
+    manifest = SimpleNamespace(
+        is_workflow=True,
+        metadata=Metadata(name="test-workflow", version="1.0.0"),
+        spec=WorkflowSpec(
+            steps=[WorkflowStep(name=name) for name in delays],
+            parallel=True,
+        ),
+    )
+    runner = WorkflowRunner(manifest, **runtime_options)  # type: ignore[arg-type]
+    execute_step = runner._execute_step
+
+    def slow_step(step: WorkflowStep, context: WorkflowContext) -> Any:
+        if hook:
+            hook(step)
+        time.sleep(delays[step.name])
+        if step.name in fail:
+            raise RuntimeError("boom")
+        return execute_step(step, context)
+
+    runner._execute_step = slow_step  # type: ignore[method-assign]
+    return runner
+
+
+class TestParallelExecution:
+    """Tests for parallel workflow execution."""
+
+    def test_steps_run_concurrently(self) -> None:
+        """Test independent steps overlap instead of running back to back."""
+        runner = make_runner({"a": 0.2, "b": 0.2, "c": 0.2, "d": 0.2})
+
+        start = time.perf_counter()
+        response = runner.run()
+        elapsed = time.perf_counter() - start
+
+        assert response.status == "success"
+        assert response.errors == []
+        assert elapsed < 0.6
+
+    def test_results_in_declaration_order(self) -> None:
+        """Test outcomes are reported in step declaration order, not completion order."""
+        runner = make_runner({"a": 0.15, "b": 0.1, "c": 0.05, "d": 0.0})
+
+        response = runner.run()
+
+        assert response.execution_order == ["a", "b", "c", "d"]
+        assert list(response.results) == ["a", "b", "c", "d"]
+
+    def test_failure_stops_without_continue_on_error(self) -> None:
+        """Test a failing step ends the run and drops steps still in flight."""
+        runner = make_runner({"a": 0.5, "b": 0.0, "c": 0.5}, fail=("b",))
+
+        response = runner.run()
+
+        assert response.errors == ["Step 'b' failed: boom"]
+        assert list(response.results) == ["b"]
+        assert response.execution_order == []
+        assert response.status == "failure"
+
+    def test_continue_on_error_collects_every_outcome(self) -> None:
+        """Test continue_on_error waits for all steps and records each result."""
+        runner = make_runner(
+            {"a": 0.1, "b": 0.0, "c": 0.1}, fail=("b",), continue_on_error=True
+        )
+
+        response = runner.run()
+
+        assert response.errors == ["Step 'b' failed: boom"]
+        assert list(response.results) == ["a", "b", "c"]
+        assert response.results["b"] == {"error": "boom"}
+        assert response.execution_order == ["a", "c"]
+        assert response.status == "partial"
+
+    def test_timeout(self) -> None:
+        """Test steps outliving the timeout produce a timeout error."""
+        runner = make_runner({"a": 0.0, "b": 1.0}, timeout=0.2)
+
+        start = time.perf_counter()
+        response = runner.run()
+
+        assert time.perf_counter() - start < 0.8
+        assert response.errors == ["Workflow timeout exceeded"]
+        assert response.execution_order == ["a"]
+        assert response.status == "partial"
+
+    def test_steps_see_caller_context(self) -> None:
+        """Test contextvars set by the caller are visible inside steps."""
+        request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id")
+        seen: Dict[str, str] = {}
+
+        def record(step: WorkflowStep) -> None:
+            seen[step.name] = request_id.get("unset")
+
+        runner = make_runner({"a": 0.0, "b": 0.0}, hook=record)
+        token = request_id.set("req-123")
+        try:
+            runner.run()
+        finally:
+            request_id.reset(token)
+
+        assert seen == {"a": "req-123", "b": "req-123"}
+
+
+class TestRuntimeOptions:
+    """Tests for workflow runtime options."""
+
+    def test_max_concurrency_bounds_parallel_steps(self) -> None:
+        """Test max_concurrency caps how many steps run at once."""
+        lock = threading.Lock()
+        in_flight: List[int] = [0]
+        peak: List[int] = [0]
+
+        def track(step: WorkflowStep) -> None:
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.05)
+            with lock:
+                in_flight[0] -= 1
+
+        runner = make_runner(dict.fromkeys("abcdef", 0.0), hook=track, max_concurrency=2)
+
+        response = runner.run()
+
+        assert response.status == "success"
+        assert peak[0] == 2
+
+    @pytest.mark.parametrize("value", [0, -1, 1.5, "2", True])
+    def test_invalid_max_concurrency(self, value: Any) -> None:
+        """Test invalid max_concurrency values are rejected at construction."""
+        with pytest.raises(ConfigurationError, match="max_concurrency"):
+            make_runner({"a": 0.0}, max_concurrency=value)